@@ -6,27 +6,91 @@ Supports both legacy API v1 and OAuth-based API v2
 """
 
 import argparse
+import asyncio
 import csv
 import datetime
+import email.utils
 import getpass
 import hashlib
 import json
 import logging
+import os
+import random
 import sys
 import time
-from collections import OrderedDict
-from typing import Dict, List, Optional, Any, Union
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from itertools import count
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Union
+from urllib.parse import urlencode
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # API endpoints
 OLD_API_ROOT = 'http://api.myshows.ru'
 NEW_API_ROOT = 'https://api.myshows.me/v2/rpc/'
 OAUTH_TOKEN_URL = 'https://myshows.me/oauth/token'
 
+# OAuth token cache, reused between runs until the token expires
+TOKEN_CACHE_FILE = '~/.myshows_token.json'
+
+# API v1 session cookie cache, reused between runs while the session is valid
+COOKIE_CACHE_FILE = '~/.myshows_v1_cookies.json'
+
+# Maximum number of JSON-RPC batches in flight via API v2
+ASYNC_CONCURRENCY = 8
+
+# Number of shows per JSON-RPC batch (two calls per show)
+RPC_BATCH_SIZE = 50
+
+# HTTP connection pool size per session
+POOL_SIZE = 32
+
+# Headers sent with every request
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'myshows-backup/1.0'
+}
+
+# Retry settings for throttling (429) and server errors (5xx)
+MAX_RETRIES = 6
+BACKOFF_MAX = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# CSV export columns
+CSV_FULL_FIELDS = (
+    'username', 'show_id', 'title', 'title_original', 'title_ru', 'year',
+    'my_status', 'show_status', 'site_rating', 'my_rating',
+    'imdb_id', 'imdb_rating', 'kinopoisk_id', 'kinopoisk_rating',
+    'country', 'network', 'genres',
+    'total_episodes', 'watched_episodes', 'total_seasons',
+    'runtime', 'started', 'ended', 'description',
+    'first_episode_watched', 'last_episode_watched', 'days_watching'
+)
+CSV_LITE_FIELDS = ('title_original', 'title_ru', 'year', 'my_rating', 'status')
+
+# Show record fields copied as-is into CSV columns 'show_id' through 'ended'
+CSV_SHOW_COLUMNS = itemgetter(
+    'id', 'title', 'titleOriginal', 'ruTitle', 'year',
+    'status', 'showStatus', 'rating', 'myRating',
+    'imdbId', 'imdbRating', 'kinopoiskId', 'kinopoiskRating',
+    'country', 'network', 'genres',
+    'totalEpisodes', 'watchedEpisodes', 'totalSeasons',
+    'runtime', 'started', 'ended'
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +100,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class Episode:
+    """Watched episode record, serialized as a JSON object"""
+    __slots__ = ('id', 'title', 'season', 'number', 'airDate', 'watched', 'rating')
+    
+    id: Any
+    title: str
+    season: Any
+    number: Any
+    airDate: str
+    watched: str
+    rating: Any
+
+
 class OldAPI:
     """Legacy MyShows API v1 client with MD5 authentication"""
     
@@ -44,18 +122,28 @@ class OldAPI:
         self.password = password
         self.session = self._create_session()
         self._authenticated = False
+        self._auth_url: Optional[str] = None
         
     def _create_session(self) -> requests.Session:
-        """Create HTTP session with retry mechanism"""
+        """Create pooled keep-alive HTTP session with jittered exponential backoff"""
         session = requests.Session()
         retry = Retry(
-            total=3,
-            backoff_factor=0.3,
-            status_forcelist=[500, 502, 503, 504]
+            total=MAX_RETRIES,
+            backoff_factor=1.0,
+            backoff_jitter=1.0,
+            backoff_max=BACKOFF_MAX,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
+        session.headers.update(DEFAULT_HEADERS)
         return session
         
     def _make_request(self, url: str, **kwargs) -> requests.Response:
@@ -66,20 +154,57 @@ class OldAPI:
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {full_url}: {e}")
+            logger.error("Request failed for %s: %s", full_url, e)
             raise
             
+    def _restore_session(self) -> bool:
+        """Restore session cookies saved by a previous login and verify them"""
+        cache = load_cache_file(COOKIE_CACHE_FILE)
+        if cache.get('username') != self.username or not cache.get('cookies'):
+            return False
+        
+        self.session.cookies.update(cache['cookies'])
+        try:
+            response = self.session.get(OLD_API_ROOT + '/profile/', timeout=30)
+            if response.status_code == 200:
+                return True
+        except requests.exceptions.RequestException as e:
+            logger.debug("Cached session check failed: %s", e)
+        
+        self.session.cookies.clear()
+        return False
+        
+    def _save_session(self) -> None:
+        """Save session cookies to disk for later runs"""
+        cache = {
+            'username': self.username,
+            'cookies': requests.utils.dict_from_cookiejar(self.session.cookies)
+        }
+        
+        try:
+            save_cache_file(COOKIE_CACHE_FILE, cache)
+        except OSError as e:
+            logger.warning("Failed to save session cookie cache: %s", e)
+            
     def authenticate(self) -> bool:
-        """Authenticate user with MD5 hashed password"""
+        """Authenticate user, reusing a cached session when it is still valid"""
+        if self._restore_session():
+            self._authenticated = True
+            logger.info("Reusing cached API v1 session for %s", self.username)
+            return True
+        
         try:
-            password_md5 = hashlib.md5(self.password.encode()).hexdigest()
-            url = f'/profile/login?login={self.username}&password={password_md5}'
-            response = self._make_request(url)
+            if self._auth_url is None:
+                # Encode the query so usernames with '&', '%' or non-ASCII characters survive
+                password_md5 = hashlib.md5(self.password.encode()).hexdigest()
+                self._auth_url = '/profile/login?' + urlencode({'login': self.username, 'password': password_md5})
+            response = self._make_request(self._auth_url)
             self._authenticated = True
-            logger.info(f"Successfully authenticated via API v1 for {self.username}")
+            self._save_session()
+            logger.info("Successfully authenticated via API v1 for %s", self.username)
             return True
         except Exception as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             return False
             
     def get_all_shows(self) -> Dict[str, Any]:
@@ -112,103 +237,287 @@ class NewAPI:
         self.password = password
         self.session = self._create_session()
         self.access_token = None
-        self._request_id = 0
+        self.refresh_token = None
+        self.expires_at = 0.0
+        self._request_ids = count(1)
+        self._load_token_cache()
         
     def _create_session(self) -> requests.Session:
-        """Create HTTP session with retry mechanism"""
+        """Create pooled keep-alive HTTP session with jittered exponential backoff"""
         session = requests.Session()
         retry = Retry(
-            total=3,
-            backoff_factor=0.3,
-            status_forcelist=[500, 502, 503, 504]
+            total=MAX_RETRIES,
+            backoff_factor=1.0,
+            backoff_jitter=1.0,
+            backoff_max=BACKOFF_MAX,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
+        session.headers.update(DEFAULT_HEADERS)
         return session
         
+    def _load_token_cache(self) -> None:
+        """Load OAuth token saved by a previous run for the same account"""
+        cache = load_cache_file(TOKEN_CACHE_FILE)
+        if cache.get('client_id') != self.client_id or cache.get('username') != self.username:
+            return
+        
+        self.access_token = cache.get('access_token')
+        self.refresh_token = cache.get('refresh_token')
+        self.expires_at = cache.get('expires_at', 0.0)
+        
+    def _save_token_cache(self) -> None:
+        """Save OAuth token to disk for later runs"""
+        cache = {
+            'client_id': self.client_id,
+            'username': self.username,
+            'access_token': self.access_token,
+            'refresh_token': self.refresh_token,
+            'expires_at': self.expires_at
+        }
+        
+        try:
+            save_cache_file(TOKEN_CACHE_FILE, cache)
+        except OSError as e:
+            logger.warning("Failed to save OAuth token cache: %s", e)
+            
+    def _request_token(self, data: Dict[str, Any]) -> None:
+        """Request OAuth token and store it in the cache"""
+        response = self.session.post(OAUTH_TOKEN_URL, data=data, timeout=30)
+        response.raise_for_status()
+        
+        token_data = response.json()
+        self.access_token = token_data['access_token']
+        self.refresh_token = token_data.get('refresh_token', self.refresh_token)
+        self.expires_at = time.time() + token_data.get('expires_in', 0)
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+        self._save_token_cache()
+        
     def authenticate(self) -> bool:
-        """Obtain OAuth access token"""
+        """Obtain OAuth access token, reusing or refreshing a cached one"""
+        if self.access_token and self.expires_at - time.time() > 60:
+            self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+            logger.info("Using cached OAuth token for %s", self.username)
+            return True
+        
+        if self.refresh_token:
+            try:
+                self._request_token({
+                    'grant_type': 'refresh_token',
+                    'refresh_token': self.refresh_token,
+                    'client_id': self.client_id,
+                    'client_secret': self.client_secret
+                })
+                logger.info("Successfully refreshed OAuth token for %s", self.username)
+                return True
+            except Exception as e:
+                logger.warning("OAuth token refresh failed, logging in again: %s", e)
+        
         try:
             # Resource Owner Password Credentials Grant
-            data = {
+            self._request_token({
                 'grant_type': 'password',
                 'client_id': self.client_id,
                 'client_secret': self.client_secret,
                 'username': self.username,
                 'password': self.password
-            }
-            
-            response = self.session.post(OAUTH_TOKEN_URL, data=data, timeout=30)
-            response.raise_for_status()
-            
-            token_data = response.json()
-            self.access_token = token_data['access_token']
-            logger.info(f"Successfully authenticated via OAuth for {self.username}")
+            })
+            logger.info("Successfully authenticated via OAuth for %s", self.username)
             return True
         except Exception as e:
-            logger.error(f"OAuth authentication failed: {e}")
+            logger.error("OAuth authentication failed: %s", e)
             return False
             
-    def _make_rpc_request(self, method: str, params: Optional[Dict] = None) -> Any:
-        """Execute JSON-RPC request"""
-        self._request_id += 1
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.access_token}'
-        }
+    def _reauthenticate(self) -> bool:
+        """Drop the rejected access token and authenticate again"""
+        logger.warning("OAuth token was rejected, authenticating again")
+        self.access_token = None
+        self.expires_at = 0.0
+        self.session.headers.pop('Authorization', None)
+        self._save_token_cache()
+        return self.authenticate()
         
-        payload = {
-            'jsonrpc': '2.0',
-            'method': method,
-            'params': params or {},
-            'id': self._request_id
-        }
+    def _make_rpc_batch(self, calls: List[Tuple[str, Dict]]) -> List[Any]:
+        """Execute several JSON-RPC calls in a single batch request"""
+        payload = []
+        for method, params in calls:
+            payload.append({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or {},
+                'id': next(self._request_ids)
+            })
         
         try:
             response = self.session.post(
                 NEW_API_ROOT,
                 json=payload,
-                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
-            
-            result = response.json()
-            if 'error' in result:
-                raise Exception(f"RPC Error: {result['error']}")
-                
-            return result.get('result')
+            return unpack_rpc_batch(payload, response.json())
         except Exception as e:
-            logger.error(f"RPC request failed for {method}: {e}")
+            logger.error("RPC batch request failed: %s", e)
             raise
             
     def get_all_shows(self) -> List[Dict[str, Any]]:
         """Retrieve all user's TV shows across all statuses"""
         all_shows = []
+        statuses = ['watching', 'later', 'cancelled', 'completed']
         
-        for status in ['watching', 'later', 'cancelled', 'completed']:
-            try:
-                shows = self._make_rpc_request('lists.Shows', {'list': status})
-                for show in shows:
-                    show['list_status'] = status
-                all_shows.extend(shows)
-            except Exception as e:
-                logger.warning(f"Failed to get shows with status {status}: {e}")
+        # Fetch all statuses in one batch request
+        calls = [('lists.Shows', {'list': status}) for status in statuses]
+        try:
+            results = self._make_rpc_batch(calls)
+        except requests.HTTPError as e:
+            # A cached token may have been revoked before it expired
+            if e.response is None or e.response.status_code != 401 or not self._reauthenticate():
+                raise
+            results = self._make_rpc_batch(calls)
+        for status, shows in zip(statuses, results):
+            if shows is None:
+                logger.warning("Failed to get shows with status %s", status)
+                continue
+            for show in shows:
+                show['list_status'] = status
+            all_shows.extend(shows)
                 
         return all_shows
+
+
+class AsyncNewAPI:
+    """Asynchronous MyShows API v2.0 client for concurrent show requests"""
+    
+    def __init__(self, access_token: str):
+        self.access_token = access_token
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._request_ids = count(1)
         
-    def get_show_details(self, show_id: int) -> Dict[str, Any]:
-        """Get detailed information about a specific show"""
-        return self._make_rpc_request('shows.GetById', {'showId': show_id})
+    async def __aenter__(self) -> 'AsyncNewAPI':
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=ASYNC_CONCURRENCY),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={**DEFAULT_HEADERS, 'Authorization': f'Bearer {self.access_token}'}
+        )
+        return self
         
-    def get_watched_episodes(self, show_id: int) -> List[Dict[str, Any]]:
-        """Get list of watched episodes for a show"""
-        return self._make_rpc_request('shows.GetEpisodes', {
-            'showId': show_id,
-            'isWatched': True
-        })
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.close()
+        
+    async def _post(self, payload: Any, description: str) -> Any:
+        """POST JSON-RPC payload with backoff on throttling, server and connection errors"""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self.session.post(NEW_API_ROOT, json=payload) as response:
+                    if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+                        
+                    delay = get_retry_delay(attempt, response.headers.get('Retry-After'))
+                    reason = f'HTTP {response.status}'
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Retried like the urllib3 Retry on the requests session does
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = get_retry_delay(attempt)
+                reason = repr(e)
+                
+            logger.warning("%s for %s, retrying in %.1fs (attempt %d/%d)",
+                           reason, description, delay, attempt + 1, MAX_RETRIES)
+            await asyncio.sleep(delay)
+            
+    async def _make_rpc_batch(self, calls: List[Tuple[str, Dict]]) -> List[Any]:
+        """Execute several JSON-RPC calls in a single batch request"""
+        payload = []
+        for method, params in calls:
+            payload.append({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or {},
+                'id': next(self._request_ids)
+            })
+        
+        try:
+            return unpack_rpc_batch(payload, await self._post(payload, 'batch'))
+        except Exception as e:
+            logger.error("RPC batch request failed: %s", e)
+            raise
+            
+    async def get_shows_data(self, show_ids: List[int]) -> List[Tuple[Any, Any]]:
+        """Get details and watched episodes for several shows in one batch"""
+        calls = []
+        for show_id in show_ids:
+            calls.append(('shows.GetById', {'showId': show_id}))
+            calls.append(('shows.GetEpisodes', {'showId': show_id, 'isWatched': True}))
+        
+        results = await self._make_rpc_batch(calls)
+        return list(zip(results[::2], results[1::2]))
+
+
+def unpack_rpc_batch(payload: List[Dict[str, Any]], response_data: Any) -> List[Any]:
+    """Match JSON-RPC batch responses to calls by id, None for failed calls"""
+    if not isinstance(response_data, list):
+        raise Exception(f"RPC Error: {response_data.get('error', response_data)}")
+    
+    responses = {item.get('id'): item for item in response_data}
+    results = []
+    for call in payload:
+        item = responses.get(call['id'], {})
+        if 'result' in item:
+            results.append(item['result'])
+        else:
+            logger.warning("RPC Error for %s: %s", call['method'], item.get('error', 'no response'))
+            results.append(None)
+    
+    return results
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Compute delay before the next retry, honoring the Retry-After header"""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), BACKOFF_MAX)
+        except ValueError:
+            pass
+        try:
+            retry_date = email.utils.parsedate_to_datetime(retry_after)
+            delay = (retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            return min(max(delay, 0.0), BACKOFF_MAX)
+        except (TypeError, ValueError):
+            pass
+    
+    # Full exponential backoff with jitter
+    return min(min(32, 2 ** attempt) + random.uniform(0, 1), BACKOFF_MAX)
+
+
+def load_cache_file(path: str) -> Dict[str, Any]:
+    """Read a JSON cache file, returning an empty dict if it is missing or invalid"""
+    try:
+        with open(os.path.expanduser(path), encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache_file(path: str, data: Dict[str, Any]) -> None:
+    """Atomically write a JSON cache file readable by the owner only"""
+    cache_file = os.path.expanduser(path)
+    tmp_file = cache_file + '.tmp'
+    
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_file, cache_file)
 
 
 def safe_join_genres(genres: Any) -> str:
@@ -216,16 +525,28 @@ def safe_join_genres(genres: Any) -> str:
     if not genres:
         return ''
     
-    # Convert all elements to strings
     if isinstance(genres, list):
-        return ', '.join(str(g) for g in genres)
+        # Fast path: API usually returns a list of strings
+        if isinstance(genres[0], str):
+            try:
+                return ', '.join(genres)
+            except TypeError:
+                pass
+        return ', '.join(map(str, genres))
     elif isinstance(genres, dict):
         # Handle genres as dictionary {id: name}
-        return ', '.join(str(v) for v in genres.values())
+        return ', '.join(map(str, genres.values()))
     else:
         return str(genres)
 
 
+def truncate_text(text: Optional[str], limit: int = 200) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis"""
+    if not text:
+        return ''
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
 def process_show_data(show_info: Dict[str, Any], 
                      show_details: Dict[str, Any], 
                      episodes: Union[Dict[str, Any], List[Dict[str, Any]]],
@@ -264,27 +585,32 @@ def process_show_data(show_info: Dict[str, Any],
         'description': show_details.get('description', ''),
         'started': show_details.get('started', ''),
         'ended': show_details.get('ended', ''),
+        'firstWatched': '',
+        'lastWatched': '',
         'episodes': []
     }
     
     # Process episodes data
     if episodes:
-        if isinstance(episodes, dict):
-            # Legacy API returns dictionary
-            episodes_list = list(episodes.values())
-        else:
-            # New API returns list
-            episodes_list = episodes
+        # Legacy API returns dictionary, new API returns list
+        episodes_list = episodes.values() if isinstance(episodes, dict) else episodes
+        
+        # Hoist lookups out of the per-episode loop
+        is_v1 = api_version == 'v1'
+        episodes_meta = show_details.get('episodes') if is_v1 else None
+        parse_iso_date = datetime.date.fromisoformat
+        parse_date = datetime.datetime.strptime
+        append_episode = show_data['episodes'].append
             
         for episode in episodes_list:
             # Parse watch date
             watch_date = episode.get('watchDate', episode.get('watchedAt', ''))
             if watch_date:
                 try:
-                    if 'T' in str(watch_date):  # ISO format
-                        watched = datetime.datetime.fromisoformat(watch_date.replace('Z', '+00:00')).date()
+                    if 'T' in str(watch_date):  # ISO format, date part is YYYY-MM-DD
+                        watched = parse_iso_date(watch_date[:10])
                     else:  # Legacy format dd.mm.yyyy
-                        watched = datetime.datetime.strptime(watch_date, '%d.%m.%Y').date()
+                        watched = parse_date(watch_date, '%d.%m.%Y').date()
                     watch_date_iso = watched.isoformat()
                 except (ValueError, AttributeError):
                     watch_date_iso = str(watch_date)
@@ -292,121 +618,149 @@ def process_show_data(show_info: Dict[str, Any],
                 watch_date_iso = ''
             
             # Extract episode information
-            if api_version == 'v1':
-                episode_data = show_details.get('episodes', {}).get(str(episode.get('id', '')), {})
-                season_num = episode_data.get('seasonNumber', '')
-                episode_num = episode_data.get('episodeNumber', '')
-                episode_title = episode_data.get('title', '')
+            if is_v1:
+                episode_data = episodes_meta.get(str(episode.get('id', ''))) if episodes_meta else None
+                if episode_data:
+                    season_num = episode_data.get('seasonNumber', '')
+                    episode_num = episode_data.get('episodeNumber', '')
+                    episode_title = episode_data.get('title', '')
+                else:
+                    season_num = episode_num = episode_title = ''
             else:
                 season_num = episode.get('seasonNumber', episode.get('season', ''))
                 episode_num = episode.get('episodeNumber', episode.get('episode', ''))
                 episode_title = episode.get('title', '')
             
-            episode_info = OrderedDict([
-                ('id', episode.get('id', episode.get('episodeId', ''))),
-                ('title', episode_title),
-                ('season', season_num),
-                ('number', episode_num),
-                ('airDate', episode.get('airDate', '')),
-                ('watched', watch_date_iso),
-                ('rating', episode.get('rating', 'NA'))
-            ])
-            
-            show_data['episodes'].append(episode_info)
+            append_episode(Episode(
+                id=episode.get('id', episode.get('episodeId', '')),
+                title=episode_title,
+                season=season_num,
+                number=episode_num,
+                airDate=episode.get('airDate', ''),
+                watched=watch_date_iso,
+                rating=episode.get('rating', 'NA')
+            ))
     
     # Sort episodes by watch date
     if show_data['episodes']:
-        show_data['episodes'].sort(key=lambda e: e['watched'] or '')
+        show_data['episodes'].sort(key=attrgetter('watched'))
+        
+        # Episodes are sorted, so the watch date range is at the ends
+        watched_dates = [e.watched for e in show_data['episodes'] if e.watched]
+        if watched_dates:
+            show_data['firstWatched'] = watched_dates[0]
+            show_data['lastWatched'] = watched_dates[-1]
     
     return show_data
 
 
+def dump_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=asdict).encode('utf-8')
+
+
 def export_to_csv(shows_data: List[Dict[str, Any]], output_file: str, username: str):
     """Export shows data to CSV format for easy import into other tools"""
-    csv_file = output_file.replace('.json', '.csv') if output_file.endswith('.json') else output_file + '.csv'
+    output_path = Path(output_file)
+    csv_path = output_path.with_suffix('.csv')
+    if csv_path == output_path:
+        # Never overwrite the JSON output itself
+        csv_path = output_path.with_name(output_path.name + '.csv')
+    lite_csv_path = output_path.with_name(output_path.stem + '_lite.csv')
     
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        # Prepare flattened data for CSV
-        rows = []
+    parse_iso_date = datetime.date.fromisoformat
+    
+    with ExitStack() as stack:
+        full_writer = csv.writer(stack.enter_context(open(csv_path, 'w', newline='', encoding='utf-8')))
+        lite_writer = csv.writer(stack.enter_context(open(lite_csv_path, 'w', newline='', encoding='utf-8')))
+        
+        full_writer.writerow(CSV_FULL_FIELDS)
+        lite_writer.writerow(CSV_LITE_FIELDS)
         
+        # Write both files in a single pass over the shows
         for show in shows_data:
-            # Base show information
-            base_info = {
-                'username': username,
-                'show_id': show['id'],
-                'title': show['title'],
-                'title_original': show['titleOriginal'],
-                'title_ru': show['ruTitle'],
-                'year': show['year'],
-                'my_status': show['status'],
-                'show_status': show['showStatus'],
-                'site_rating': show['rating'],
-                'my_rating': show['myRating'],
-                'imdb_id': show['imdbId'],
-                'imdb_rating': show['imdbRating'],
-                'kinopoisk_id': show['kinopoiskId'],
-                'kinopoisk_rating': show['kinopoiskRating'],
-                'country': show['country'],
-                'network': show['network'],
-                'genres': show['genres'],
-                'total_episodes': show['totalEpisodes'],
-                'watched_episodes': show['watchedEpisodes'],
-                'total_seasons': show['totalSeasons'],
-                'runtime': show['runtime'],
-                'started': show['started'],
-                'ended': show['ended'],
-                'description': show['description'][:200] + '...' if show['description'] and len(show['description']) > 200 else (show['description'] or '')
-            }
+            first_watched = show['firstWatched']
+            last_watched = show['lastWatched']
+            days_watching = 0
+            if first_watched and last_watched:
+                try:
+                    days_watching = (parse_iso_date(last_watched) - parse_iso_date(first_watched)).days
+                except ValueError:
+                    pass
             
-            # Add aggregated episode information
-            if show['episodes']:
-                first_watched = min(e['watched'] for e in show['episodes'] if e['watched'])
-                last_watched = max(e['watched'] for e in show['episodes'] if e['watched'])
-                base_info['first_episode_watched'] = first_watched
-                base_info['last_episode_watched'] = last_watched
-                base_info['days_watching'] = (datetime.datetime.fromisoformat(last_watched) - 
-                                            datetime.datetime.fromisoformat(first_watched)).days if first_watched and last_watched else 0
-            else:
-                base_info['first_episode_watched'] = ''
-                base_info['last_episode_watched'] = ''
-                base_info['days_watching'] = 0
+            full_writer.writerow((
+                username,
+                *CSV_SHOW_COLUMNS(show),
+                truncate_text(show['description']),
+                first_watched,
+                last_watched,
+                days_watching
+            ))
             
-            rows.append(base_info)
-        
-        # Write CSV
-        if rows:
-            fieldnames = list(rows[0].keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            lite_writer.writerow((
+                show['titleOriginal'] or show['title'],
+                show['ruTitle'] or show['title'],
+                show['year'],
+                show['myRating'],
+                show['status']
+            ))
             
-    logger.info(f"Full CSV data exported to: {csv_file}")
+    logger.info("Full CSV data exported to: %s", csv_path)
+    logger.info("Lightweight CSV exported to: %s", lite_csv_path)
     
-    # Export lightweight CSV with minimal data
-    lite_csv_file = output_file.replace('.json', '_lite.csv') if output_file.endswith('.json') else output_file.replace('.csv', '_lite.csv')
+    return str(csv_path)
+
+
+async def fetch_shows_async(access_token: str, all_shows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fetch and process API v2 shows in concurrent JSON-RPC batches"""
+    show_items = []
+    for show_info in all_shows:
+        # v2 returns list of dicts
+        if not isinstance(show_info, dict):
+            logger.error("Unexpected show_info type: %s", type(show_info))
+            continue
+        
+        show_id = show_info.get('show', {}).get('id') or show_info.get('id')
+        if not show_id:
+            show_title = show_info.get('show', {}).get('title') or show_info.get('title', 'Unknown')
+            logger.error("No show ID found for %s", show_title)
+            continue
+        
+        show_items.append((int(show_id), show_info))
+    
+    semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    total = len(show_items)
     
-    with open(lite_csv_file, 'w', newline='', encoding='utf-8') as f:
-        lite_rows = []
+    async with AsyncNewAPI(access_token) as api:
         
-        for show in shows_data:
-            lite_info = {
-                'title_original': show['titleOriginal'] or show['title'],
-                'title_ru': show['ruTitle'] or show['title'],
-                'year': show['year'],
-                'my_rating': show['myRating'],
-                'status': show['status']
-            }
-            lite_rows.append(lite_info)
-        
-        if lite_rows:
-            fieldnames = ['title_original', 'title_ru', 'year', 'my_rating', 'status']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(lite_rows)
+        async def fetch_batch(offset: int, batch: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                logger.info("Processing shows %d-%d/%d", offset + 1, offset + len(batch), total)
+                try:
+                    shows_data = await api.get_shows_data([show_id for show_id, _ in batch])
+                except Exception as e:
+                    logger.error("Failed to process shows %d-%d: %s", offset + 1, offset + len(batch), e)
+                    return []
             
-    logger.info(f"Lightweight CSV exported to: {lite_csv_file}")
+            batch_data = []
+            for (show_id, show_info), (show_details, episodes) in zip(batch, shows_data):
+                try:
+                    if show_details is None or episodes is None:
+                        raise Exception("incomplete RPC response")
+                    batch_data.append(process_show_data(show_info, show_details, episodes, 'v2'))
+                except Exception as e:
+                    logger.error("Failed to process show %s: %s", show_id, e)
+            
+            return batch_data
+        
+        batches = await asyncio.gather(*(
+            fetch_batch(offset, show_items[offset:offset + RPC_BATCH_SIZE])
+            for offset in range(0, total, RPC_BATCH_SIZE)
+        ))
     
-    return csv_file
+    return [show_data for batch_data in batches for show_data in batch_data]
 
 
 def backup_shows(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None, 
@@ -433,7 +787,7 @@ def backup_shows(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None,
         total = len(all_shows)
         for index, (show_id, show_info) in enumerate(all_shows.items(), 1):
             try:
-                logger.info(f"Processing show {index}/{total}: {show_info.get('title', 'Unknown')}")
+                logger.info("Processing show %d/%d: %s", index, total, show_info.get('title', 'Unknown'))
                 
                 show_details = api.get_show_details(show_info['showId'])
                 episodes = api.get_watched_episodes(show_info['showId'])
@@ -441,47 +795,15 @@ def backup_shows(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None,
                 show_data = process_show_data(show_info, show_details, episodes, api_version)
                 shows_data.append(show_data)
                 
-                # Small delay between requests to avoid rate limiting
-                time.sleep(0.1)
-                
             except Exception as e:
-                logger.error(f"Failed to process show {show_id}: {e}")
+                logger.error("Failed to process show %s: %s", show_id, e)
                 continue
     else:
-        total = len(all_shows)
-        for index, show_info in enumerate(all_shows, 1):
-            try:
-                # v2 returns list of dicts
-                if isinstance(show_info, dict):
-                    show_id = show_info.get('show', {}).get('id') or show_info.get('id')
-                    show_title = show_info.get('show', {}).get('title') or show_info.get('title', 'Unknown')
-                else:
-                    logger.error(f"Unexpected show_info type: {type(show_info)}")
-                    continue
-                
-                if not show_id:
-                    logger.error(f"No show ID found for {show_title}")
-                    continue
-                    
-                logger.info(f"Processing show {index}/{total}: {show_title}")
-                
-                show_details = api.get_show_details(int(show_id))
-                episodes = api.get_watched_episodes(int(show_id))
-                
-                show_data = process_show_data(show_info, show_details, episodes, api_version)
-                shows_data.append(show_data)
-                
-                # Small delay between requests to avoid rate limiting
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Failed to process show: {e}")
-                continue
+        # v2 shows are fetched concurrently
+        shows_data = asyncio.run(fetch_shows_async(api.access_token, all_shows))
     
-    # Sort shows by first watched episode date
-    shows_data.sort(key=lambda show: (
-        show['episodes'][0]['watched'] if show['episodes'] else '9999-99-99'
-    ))
+    # Sort shows by first watched episode date, shows never watched last
+    shows_data.sort(key=lambda show: show['firstWatched'] or '9999-99-99')
     
     # Prepare final result
     username = getattr(api, 'username', 'unknown')
@@ -498,14 +820,15 @@ def backup_shows(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None,
     # Save results
     if output_file:
         # Save JSON
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        logger.info(f"JSON data saved to: {output_file}")
+        with open(output_file, 'wb') as f:
+            f.write(dump_json(result))
+        logger.info("JSON data saved to: %s", output_file)
         
         # Export CSV for data analysis
         export_to_csv(shows_data, output_file, username)
     else:
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dump_json(result) + b'\n')
     
     return shows_data
 
@@ -615,7 +938,7 @@ Output files:
         print("\n\nOperation cancelled by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Backup failed: {e}")
+        logger.error("Backup failed: %s", e)
         sys.exit(1)
 
 
@@ -1,25 +1,36 @@
 #!/usr/bin/env python3
 """
 MyShows.me Fast Backup Script
-Optimized version with parallel processing for faster exports
+Optimized version with concurrent processing on an asyncio event loop
 """
 
 import argparse
+import asyncio
 import csv
 import datetime
+import email.utils
 import getpass
 import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
 import time
-from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Any, Union, Tuple
+from urllib.parse import urlencode
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # API endpoints
@@ -28,13 +39,29 @@ NEW_API_ROOT = 'https://api.myshows.me/v2/rpc/'
 OAUTH_TOKEN_URL = 'https://myshows.me/oauth/token'
 
 # Performance settings
-MAX_WORKERS = 5   # Balanced parallel workers for good performance
-BATCH_SIZE = 25   # Optimal batch size for processing
+MAX_WORKERS = 5   # Balanced concurrent workers for good performance
+MAX_CONCURRENCY = 32  # Ceiling for adaptive worker scaling
+PROCESS_WORKERS = os.cpu_count() or 1  # Processes normalizing fetched show data
+BATCH_SIZE = 25   # Shows per JSON-RPC batch request (API v2)
 REQUEST_DELAY = 0.1  # Balanced delay between requests
 
 # Error handling settings
-MAX_503_RETRIES = 5  # Special handling for 503 errors
+MAX_503_RETRIES = 5  # Attempts for 503 and other transient server errors
 BACKOFF_DELAY = 1.0  # Initial delay for exponential backoff
+BACKOFF_MAX = 60.0   # Upper bound for any single backoff, including Retry-After
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# CSV export columns
+CSV_FULL_FIELDS = (
+    'username', 'show_id', 'title', 'title_original', 'title_ru', 'year',
+    'my_status', 'show_status', 'site_rating', 'my_rating',
+    'imdb_id', 'imdb_rating', 'kinopoisk_id', 'kinopoisk_rating',
+    'country', 'network', 'genres',
+    'total_episodes', 'watched_episodes', 'total_seasons',
+    'runtime', 'started', 'ended', 'description',
+    'first_episode_watched', 'last_episode_watched', 'days_watching'
+)
+CSV_LITE_FIELDS = ('title_original', 'title_ru', 'year', 'my_rating', 'status')
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +71,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO, including the v1 login URL with the password hash
+logging.getLogger('httpx').setLevel(logging.WARNING)
+logging.getLogger('httpcore').setLevel(logging.WARNING)
+
+
+@dataclass
+class Episode:
+    """Watched episode record, serialized as a JSON object"""
+    __slots__ = ('id', 'title', 'season', 'number', 'airDate', 'watched', 'rating')
+    
+    id: Any
+    title: str
+    season: Any
+    number: Any
+    airDate: str
+    watched: str
+    rating: Any
+
+
+class RequestScheduler:
+    """Spaces requests across all concurrent workers by reserving send times on a monotonic clock"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval  # Minimum seconds between request starts
+        self._next_ok = 0.0
+        self._paused_until = 0.0
+        
+    def pause(self, delay: float) -> None:
+        """Hold back all requests for at least delay seconds"""
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        
+    async def acquire(self) -> None:
+        """Reserve the next free send slot and wait for it"""
+        while True:
+            now = time.monotonic()
+            start = max(now, self._next_ok, self._paused_until)
+            self._next_ok = start + self.interval
+            if start <= now:
+                return
+            
+            await asyncio.sleep(start - now)
+            # A pause set while waiting moves this request behind it
+            if time.monotonic() >= self._paused_until:
+                return
+
+
+# Shared by both API clients: each worker averages one request per REQUEST_DELAY
+# (rebuilt for every run in fetch_shows_async)
+RATE_LIMITER = RequestScheduler(REQUEST_DELAY / MAX_WORKERS)
+
+
+class AdaptiveLimiter:
+    """Concurrency limit tuned by AIMD from the observed rate of throttled responses"""
+    
+    def __init__(self, initial: int, maximum: int, window: int = 20):
+        self.limit = initial
+        self.maximum = max(initial, maximum)
+        self.window = window  # Responses per adjustment
+        self._active = 0
+        self._responses = 0
+        self._throttled = 0
+        self._condition: Optional[asyncio.Condition] = None
+        
+    async def __aenter__(self) -> None:
+        # Created on first use, inside the event loop of the run that built this limiter
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+            
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+            
+    def record(self, throttled: bool) -> None:
+        """Count a response and adjust the limit once per window"""
+        self._responses += 1
+        self._throttled += throttled
+        if self._responses < self.window:
+            return
+        
+        rate = self._throttled / self._responses
+        self._responses = self._throttled = 0
+        if rate > 0.2:
+            # Multiplicative decrease when the server is struggling
+            self.limit = max(1, self.limit // 2)
+            logger.info(f"Throttled on {rate:.0%} of requests, reducing workers to {self.limit}")
+        elif rate < 0.05 and self.limit < self.maximum:
+            # Additive increase while the server keeps up; waiting workers
+            # pick up the extra slot when the next one finishes
+            self.limit += 1
+            logger.debug(f"Increasing workers to {self.limit}")
+
+
+# Shared by both API clients: concurrent shows (v1) or batches (v2) in flight
+# (rebuilt for every run in fetch_shows_async)
+CONCURRENCY = AdaptiveLimiter(MAX_WORKERS, MAX_CONCURRENCY)
+
+
+def create_session() -> httpx.AsyncClient:
+    """Create HTTP/2 session with a connection pool sized for the worker ceiling"""
+    # Two requests per show (or two batches per chunk) run concurrently
+    pool_size = CONCURRENCY.maximum * 2
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        ),
+        timeout=15.0,
+        # Match requests/aiohttp, e.g. for an http -> https redirect on OLD_API_ROOT
+        follow_redirects=True
+    )
+
 
 class OldAPI:
     """Legacy MyShows API v1 client with MD5 authentication"""
@@ -51,58 +194,35 @@ class OldAPI:
     def __init__(self, username: str, password: str):
         self.username = username
         self.password = password
-        self.session = self._create_session()
+        self.session: Optional[httpx.AsyncClient] = None
         self._authenticated = False
+        self._auth_url: Optional[str] = None
         
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with connection pooling and retry"""
-        session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=0.2,
-            status_forcelist=[500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(
-            max_retries=retry,
-            pool_connections=20,  # Increase connection pool
-            pool_maxsize=20
-        )
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
+    async def __aenter__(self) -> 'OldAPI':
+        self.session = create_session()
+        return self
         
-    def _make_request(self, url: str, **kwargs) -> requests.Response:
-        """Execute API request with enhanced error handling for 503s"""
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.aclose()
+        
+    async def _make_request(self, url: str) -> Any:
+        """Execute API request and decode JSON, with backoff for server errors"""
         full_url = OLD_API_ROOT + url if not url.startswith('http') else url
         
-        for attempt in range(MAX_503_RETRIES):
-            try:
-                response = self.session.get(full_url, timeout=15, **kwargs)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 503 and attempt < MAX_503_RETRIES - 1:
-                    # Exponential backoff for 503 errors
-                    wait_time = BACKOFF_DELAY * (2 ** attempt)
-                    logger.warning(f"503 error for {full_url}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{MAX_503_RETRIES})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"Request failed for {full_url}: {e}")
-                    raise
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed for {full_url}: {e}")
-                raise
-                
-        # This should never be reached due to exceptions above
-        raise RuntimeError("All retry attempts failed")
+        try:
+            return await send_request(self.session, 'GET', full_url, full_url)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Request failed for {full_url}: {e!r}")
+            raise
             
-    def authenticate(self) -> bool:
+    async def authenticate(self) -> bool:
         """Authenticate user with MD5 hashed password"""
         try:
-            password_md5 = hashlib.md5(self.password.encode()).hexdigest()
-            url = f'/profile/login?login={self.username}&password={password_md5}'
-            response = self._make_request(url)
+            if self._auth_url is None:
+                # Encode the query so usernames with '&', '%' or non-ASCII characters survive
+                password_md5 = hashlib.md5(self.password.encode()).hexdigest()
+                self._auth_url = '/profile/login?' + urlencode({'login': self.username, 'password': password_md5})
+            await self._make_request(self._auth_url)
             self._authenticated = True
             logger.info(f"Successfully authenticated via API v1 for {self.username}")
             return True
@@ -110,29 +230,28 @@ class OldAPI:
             logger.error(f"Authentication failed: {e}")
             return False
             
-    def get_all_shows(self) -> Dict[str, Any]:
+    async def get_all_shows(self) -> Dict[str, Any]:
         """Retrieve all user's TV shows"""
         if not self._authenticated:
             raise RuntimeError("Authentication required")
         
-        response = self._make_request('/profile/shows/')
-        return response.json()
+        return await self._make_request('/profile/shows/')
         
-    def get_show_details(self, show_id: int) -> Dict[str, Any]:
+    async def get_show_details(self, show_id: int) -> Dict[str, Any]:
         """Get detailed information about a specific show"""
-        response = self._make_request(f'/shows/{show_id}')
-        return response.json()
+        return await self._make_request(f'/shows/{show_id}')
         
-    def get_watched_episodes(self, show_id: int) -> Dict[str, Any]:
+    async def get_watched_episodes(self, show_id: int) -> Dict[str, Any]:
         """Get list of watched episodes for a show"""
-        response = self._make_request(f'/profile/shows/{show_id}/')
-        return response.json()
+        return await self._make_request(f'/profile/shows/{show_id}/')
         
-    def get_show_data_parallel(self, show_id: int, show_info: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    async def get_show_data_parallel(self, show_id: int, show_info: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
         """Get show details and episodes in parallel"""
         try:
-            show_details = self.get_show_details(show_id)
-            episodes = self.get_watched_episodes(show_id)
+            show_details, episodes = await asyncio.gather(
+                self.get_show_details(show_id),
+                self.get_watched_episodes(show_id)
+            )
             return show_info, show_details, episodes
         except Exception as e:
             logger.error(f"Failed to fetch data for show {show_id}: {e}")
@@ -148,28 +267,18 @@ class NewAPI:
         self.client_secret = client_secret
         self.username = username
         self.password = password
-        self.session = self._create_session()
+        self.session: Optional[httpx.AsyncClient] = None
         self.access_token = None
         self._request_id = 0
         
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with connection pooling and retry"""
-        session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=0.2,
-            status_forcelist=[500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(
-            max_retries=retry,
-            pool_connections=20,
-            pool_maxsize=20
-        )
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
+    async def __aenter__(self) -> 'NewAPI':
+        self.session = create_session()
+        return self
         
-    def authenticate(self) -> bool:
+    async def __aexit__(self, *exc_info) -> None:
+        await self.session.aclose()
+        
+    async def authenticate(self) -> bool:
         """Obtain OAuth access token"""
         try:
             data = {
@@ -180,10 +289,10 @@ class NewAPI:
                 'password': self.password
             }
             
-            response = self.session.post(OAUTH_TOKEN_URL, data=data, timeout=10)
+            response = await self.session.post(OAUTH_TOKEN_URL, data=data, timeout=10.0)
             response.raise_for_status()
+            token_data = load_json(response.content)
             
-            token_data = response.json()
             self.access_token = token_data['access_token']
             logger.info(f"Successfully authenticated via OAuth for {self.username}")
             return True
@@ -191,14 +300,18 @@ class NewAPI:
             logger.error(f"OAuth authentication failed: {e}")
             return False
             
-    def _make_rpc_request(self, method: str, params: Optional[Dict] = None) -> Any:
-        """Execute JSON-RPC request"""
-        self._request_id += 1
-        
+    async def _post_rpc(self, payload: Any, description: str) -> Any:
+        """POST JSON-RPC payload with backoff for server errors"""
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.access_token}'
         }
+        return await send_request(self.session, 'POST', NEW_API_ROOT, description,
+                                  json=payload, headers=headers)
+        
+    async def _make_rpc_request(self, method: str, params: Optional[Dict] = None) -> Any:
+        """Execute JSON-RPC request"""
+        self._request_id += 1
         
         payload = {
             'jsonrpc': '2.0',
@@ -207,81 +320,186 @@ class NewAPI:
             'id': self._request_id
         }
         
-        for attempt in range(MAX_503_RETRIES):
-            try:
-                response = self.session.post(
-                    NEW_API_ROOT,
-                    json=payload,
-                    headers=headers,
-                    timeout=15
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                if 'error' in result:
-                    raise Exception(f"RPC Error: {result['error']}")
-                    
-                return result.get('result')
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 503 and attempt < MAX_503_RETRIES - 1:
-                    # Exponential backoff for 503 errors
-                    wait_time = BACKOFF_DELAY * (2 ** attempt)
-                    logger.warning(f"503 error for {method}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{MAX_503_RETRIES})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"RPC request failed for {method}: {e}")
-                    raise
-            except Exception as e:
-                logger.error(f"RPC request failed for {method}: {e}")
-                raise
+        try:
+            result = await self._post_rpc(payload, method)
+            if 'error' in result:
+                raise Exception(f"RPC Error: {result['error']}")
                 
-        # This should never be reached due to exceptions above
-        raise RuntimeError("All retry attempts failed")
+            return result.get('result')
+        except Exception as e:
+            logger.error(f"RPC request failed for {method}: {e!r}")
+            raise
+            
+    async def _make_rpc_batch(self, calls: List[Tuple[str, Dict]]) -> List[Any]:
+        """Execute several JSON-RPC calls in a single batch request"""
+        payload = []
+        for method, params in calls:
+            self._request_id += 1
+            payload.append({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or {},
+                'id': self._request_id
+            })
+        
+        try:
+            return unpack_rpc_batch(payload, await self._post_rpc(payload, 'batch'))
+        except Exception as e:
+            logger.error(f"RPC batch request failed: {e!r}")
+            raise
             
-    def get_all_shows(self) -> List[Dict[str, Any]]:
+    async def get_all_shows(self) -> List[Dict[str, Any]]:
         """Retrieve all user's TV shows across all statuses"""
         all_shows = []
+        statuses = ['watching', 'later', 'cancelled', 'completed']
         
-        # Fetch shows from all statuses in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {}
-            for status in ['watching', 'later', 'cancelled', 'completed']:
-                future = executor.submit(self._make_rpc_request, 'lists.Shows', {'list': status})
-                futures[future] = status
-                
-            for future in as_completed(futures):
-                status = futures[future]
-                try:
-                    shows = future.result()
-                    for show in shows:
-                        show['list_status'] = status
-                    all_shows.extend(shows)
-                except Exception as e:
-                    logger.warning(f"Failed to get shows with status {status}: {e}")
+        # Fetch shows from all statuses concurrently
+        results = await asyncio.gather(*(
+            self._make_rpc_request('lists.Shows', {'list': status}) for status in statuses
+        ), return_exceptions=True)
+        
+        for status, shows in zip(statuses, results):
+            if isinstance(shows, Exception):
+                logger.warning(f"Failed to get shows with status {status}: {shows}")
+                continue
+            for show in shows:
+                show['list_status'] = status
+            all_shows.extend(shows)
                     
         return all_shows
         
-    def get_show_details(self, show_id: int) -> Dict[str, Any]:
-        """Get detailed information about a specific show"""
-        return self._make_rpc_request('shows.GetById', {'showId': show_id})
+    async def get_shows_data_batch(self, show_ids: List[int]) -> List[Tuple[Any, Any]]:
+        """Get details and watched episodes for several shows in two concurrent batch requests"""
+        details, episodes = await asyncio.gather(
+            self._make_rpc_batch([
+                ('shows.GetById', {'showId': show_id}) for show_id in show_ids
+            ]),
+            self._make_rpc_batch([
+                ('shows.GetEpisodes', {'showId': show_id, 'isWatched': True}) for show_id in show_ids
+            ])
+        )
+        return list(zip(details, episodes))
+
+
+class ShowSpool:
+    """Temporary file holding serialized shows, so only sort keys and CSV rows stay in memory"""
+    
+    def __init__(self, username: str, with_csv: bool = True):
+        self.username = username
+        self.with_csv = with_csv  # CSV rows are only needed when writing to a file
+        self.csv_rows: List[Tuple[tuple, tuple]] = []
+        self._file = tempfile.TemporaryFile()
+        self._index: List[Tuple[str, int, int]] = []  # (sort key, offset, length)
+        self._size = 0
         
-    def get_watched_episodes(self, show_id: int) -> List[Dict[str, Any]]:
-        """Get list of watched episodes for a show"""
-        return self._make_rpc_request('shows.GetEpisodes', {
-            'showId': show_id,
-            'isWatched': True
-        })
+    def __enter__(self) -> 'ShowSpool':
+        return self
         
-    def get_show_data_parallel(self, show_id: int, show_info: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
-        """Get show details and episodes in parallel"""
+    def __exit__(self, *exc_info) -> None:
+        self._file.close()
+        
+    def __len__(self) -> int:
+        return len(self._index)
+        
+    def add(self, show: Dict[str, Any]) -> None:
+        """Serialize a processed show to the spool file"""
+        # Build everything before writing so a failure leaves the spool unchanged
+        # Indented to its final nesting level under "shows"
+        data = dump_json(show).replace(b'\n', b'\n    ')
+        sort_key = show['firstWatched'] or '9999-99-99'
+        rows = csv_rows(show, self.username) if self.with_csv else None
+        
+        self._file.seek(self._size)
+        self._file.write(data)
+        self._index.append((sort_key, self._size, len(data)))
+        if rows is not None:
+            self.csv_rows.append(rows)
+        self._size += len(data)
+        
+    def sort(self) -> None:
+        """Order shows by first watched episode date"""
+        order = sorted(range(len(self._index)), key=lambda i: self._index[i][0])
+        self._index = [self._index[i] for i in order]
+        if self.with_csv:
+            self.csv_rows = [self.csv_rows[i] for i in order]
+        
+    def write_json(self, out, metadata: Dict[str, Any]) -> None:
+        """Write the final {metadata, shows} document, copying shows from the spool file"""
+        out.write(b'{\n  "metadata": ' + dump_json(metadata).replace(b'\n', b'\n  ') + b',\n  "shows": [')
+        separator = b'\n    '
+        for _, offset, length in self._index:
+            self._file.seek(offset)
+            out.write(separator)
+            out.write(self._file.read(length))
+            separator = b',\n    '
+        out.write(b'\n  ]\n}' if self._index else b']\n}')
+
+
+def get_retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Compute delay before the next retry, honoring the Retry-After header"""
+    if retry_after:
         try:
-            show_details = self.get_show_details(show_id)
-            episodes = self.get_watched_episodes(show_id)
-            return show_info, show_details, episodes
-        except Exception as e:
-            logger.error(f"Failed to fetch data for show {show_id}: {e}")
-            raise
+            return min(max(float(retry_after), 0.0), BACKOFF_MAX)
+        except ValueError:
+            pass
+        try:
+            retry_date = email.utils.parsedate_to_datetime(retry_after)
+            delay = (retry_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            return min(max(delay, 0.0), BACKOFF_MAX)
+        except (TypeError, ValueError):
+            pass
+    
+    # Exponential backoff for 503 and other transient errors
+    return min(BACKOFF_DELAY * (2 ** attempt), BACKOFF_MAX)
+
+
+async def send_request(session: httpx.AsyncClient, method: str, url: str, 
+                       description: str, **kwargs) -> Any:
+    """Send request through the shared rate limiter and decode JSON, retrying server and transport errors"""
+    for attempt in range(MAX_503_RETRIES):
+        await RATE_LIMITER.acquire()
+        try:
+            response = await session.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            # Timeouts, resets and dropped HTTP/2 streams; the transport itself only retries connects
+            CONCURRENCY.record(True)
+            if attempt == MAX_503_RETRIES - 1:
+                raise
+            wait_time = get_retry_delay(attempt)
+            reason = repr(e)
+        else:
+            CONCURRENCY.record(response.status_code in RETRY_STATUSES)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_503_RETRIES - 1:
+                response.raise_for_status()
+                return load_json(response.content)
+                
+            wait_time = get_retry_delay(attempt, response.headers.get('Retry-After'))
+            reason = f"{response.status_code} error"
+            
+        # Hold back every worker, not just this one, so retries do not pile onto a struggling server
+        RATE_LIMITER.pause(wait_time)
+        logger.warning(f"{reason} for {description}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{MAX_503_RETRIES})")
+        
+    # This should never be reached due to exceptions above
+    raise RuntimeError("All retry attempts failed")
+
+
+def unpack_rpc_batch(payload: List[Dict[str, Any]], response_data: Any) -> List[Any]:
+    """Match JSON-RPC batch responses to calls by id, None for failed calls"""
+    if not isinstance(response_data, list):
+        raise Exception(f"RPC Error: {response_data.get('error', response_data)}")
+    
+    responses = {item.get('id'): item for item in response_data}
+    results = []
+    for call in payload:
+        item = responses.get(call['id'], {})
+        if 'result' in item:
+            results.append(item['result'])
+        else:
+            logger.warning(f"RPC Error for {call['method']}: {item.get('error', 'no response')}")
+            results.append(None)
+    
+    return results
 
 
 def safe_join_genres(genres: Any) -> str:
@@ -290,13 +508,32 @@ def safe_join_genres(genres: Any) -> str:
         return ''
     
     if isinstance(genres, list):
-        return ', '.join(str(g) for g in genres)
+        # Fast path: API usually returns a list of strings
+        if isinstance(genres[0], str):
+            try:
+                return ', '.join(genres)
+            except TypeError:
+                pass
+        return ', '.join(map(str, genres))
     elif isinstance(genres, dict):
-        return ', '.join(str(v) for v in genres.values())
+        return ', '.join(map(str, genres.values()))
     else:
         return str(genres)
 
 
+def truncate_text(text: Optional[str], limit: int = 200) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis"""
+    if not text:
+        return ''
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+@lru_cache(maxsize=None)
+def parse_ddmmyyyy(value: str) -> str:
+    """Convert a legacy dd.mm.yyyy date to ISO format"""
+    return datetime.datetime.strptime(value, '%d.%m.%Y').date().isoformat()
+
+
 def process_show_data(show_info: Dict[str, Any], 
                      show_details: Dict[str, Any], 
                      episodes: Union[Dict[str, Any], List[Dict[str, Any]]],
@@ -309,12 +546,16 @@ def process_show_data(show_info: Dict[str, Any],
     else:
         show_id = show_info.get('showId')
     
+    # Look up fields used more than once a single time
+    title = show_details.get('title', '')
+    seasons = show_details.get('seasons')
+    
     # Build show data structure
     show_data: Dict[str, Any] = {
         'id': show_id,
-        'title': show_details.get('title', ''),
+        'title': title,
         'titleOriginal': show_details.get('titleOriginal', ''),
-        'ruTitle': show_details.get('ruTitle', show_details.get('title', '')),
+        'ruTitle': show_details.get('ruTitle', title),
         'year': show_details.get('year', ''),
         'status': show_info.get('list_status', show_info.get('watchStatus', '')),
         'showStatus': show_details.get('status', ''),
@@ -326,15 +567,17 @@ def process_show_data(show_info: Dict[str, Any],
         'kinopoiskRating': show_details.get('kinopoiskRating', ''),
         'country': show_details.get('country', ''),
         'network': show_details.get('network', ''),
-        'genres': safe_join_genres(show_details.get('genres', [])),
+        'genres': safe_join_genres(show_details.get('genres')),
         'totalEpisodes': show_details.get('totalEpisodes', 0),
         'watchedEpisodes': show_info.get('watchedEpisodes', 0),
-        'totalSeasons': len(show_details.get('seasons', [])) if 'seasons' in show_details else show_details.get('totalSeasons', 0),
+        'totalSeasons': len(seasons) if seasons is not None else show_details.get('totalSeasons', 0),
         'runtime': show_details.get('runtime', ''),
         'image': show_details.get('image', ''),
         'description': show_details.get('description', ''),
         'started': show_details.get('started', ''),
         'ended': show_details.get('ended', ''),
+        'firstWatched': '',
+        'lastWatched': '',
         'episodes': []
     }
     
@@ -344,23 +587,30 @@ def process_show_data(show_info: Dict[str, Any],
             episodes_list = list(episodes.values())
         else:
             episodes_list = episodes
+        
+        # Hoist lookups out of the per-episode loop
+        is_v1 = api_version == 'v1'
+        episodes_meta = show_details.get('episodes') or {}
+        append_episode = show_data['episodes'].append
             
         for episode in episodes_list:
             watch_date = episode.get('watchDate', episode.get('watchedAt', ''))
             if watch_date:
                 try:
                     if 'T' in str(watch_date):
-                        watched = datetime.datetime.fromisoformat(watch_date.replace('Z', '+00:00')).date()
+                        # ISO timestamp, the date part is already YYYY-MM-DD
+                        if len(watch_date) < 10 or watch_date[4] != '-' or watch_date[7] != '-':
+                            raise ValueError(watch_date)
+                        watch_date_iso = watch_date[:10]
                     else:
-                        watched = datetime.datetime.strptime(watch_date, '%d.%m.%Y').date()
-                    watch_date_iso = watched.isoformat()
-                except (ValueError, AttributeError):
+                        watch_date_iso = parse_ddmmyyyy(watch_date)
+                except (ValueError, TypeError):
                     watch_date_iso = str(watch_date)
             else:
                 watch_date_iso = ''
             
-            if api_version == 'v1':
-                episode_data = show_details.get('episodes', {}).get(str(episode.get('id', '')), {})
+            if is_v1:
+                episode_data = episodes_meta.get(str(episode.get('id', '')), {})
                 season_num = episode_data.get('seasonNumber', '')
                 episode_num = episode_data.get('episodeNumber', '')
                 episode_title = episode_data.get('title', '')
@@ -369,78 +619,103 @@ def process_show_data(show_info: Dict[str, Any],
                 episode_num = episode.get('episodeNumber', episode.get('episode', ''))
                 episode_title = episode.get('title', '')
             
-            episode_info = OrderedDict([
-                ('id', episode.get('id', episode.get('episodeId', ''))),
-                ('title', episode_title),
-                ('season', season_num),
-                ('number', episode_num),
-                ('airDate', episode.get('airDate', '')),
-                ('watched', watch_date_iso),
-                ('rating', episode.get('rating', 'NA'))
-            ])
-            
-            show_data['episodes'].append(episode_info)
+            append_episode(Episode(
+                id=episode.get('id', episode.get('episodeId', '')),
+                title=episode_title,
+                season=season_num,
+                number=episode_num,
+                airDate=episode.get('airDate', ''),
+                watched=watch_date_iso,
+                rating=episode.get('rating', 'NA')
+            ))
     
     if show_data['episodes']:
-        show_data['episodes'].sort(key=lambda e: e['watched'] or '')
+        show_data['episodes'].sort(key=attrgetter('watched'))
+        
+        # Episodes are sorted with undated ones first, so the watch date range is at the ends
+        last_watched = show_data['episodes'][-1].watched
+        if last_watched:
+            show_data['firstWatched'] = next(e.watched for e in show_data['episodes'] if e.watched)
+            show_data['lastWatched'] = last_watched
     
     return show_data
 
 
-def export_to_csv(shows_data: List[Dict[str, Any]], output_file: str, username: str):
-    """Export shows data to CSV format"""
+def load_json(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2, default=asdict).encode('utf-8')
+
+
+def csv_rows(show: Dict[str, Any], username: str) -> Tuple[tuple, tuple]:
+    """Build the full and lightweight CSV rows for a processed show"""
+    first_watched = show['firstWatched']
+    last_watched = show['lastWatched']
+    days_watching = 0
+    if first_watched and last_watched:
+        try:
+            days_watching = (datetime.datetime.fromisoformat(last_watched) - 
+                             datetime.datetime.fromisoformat(first_watched)).days
+        except ValueError:
+            # Unparseable watch dates are kept as raw strings by process_show_data
+            pass
+    
+    full_row = (
+        username,
+        show['id'],
+        show['title'],
+        show['titleOriginal'],
+        show['ruTitle'],
+        show['year'],
+        show['status'],
+        show['showStatus'],
+        show['rating'],
+        show['myRating'],
+        show['imdbId'],
+        show['imdbRating'],
+        show['kinopoiskId'],
+        show['kinopoiskRating'],
+        show['country'],
+        show['network'],
+        show['genres'],
+        show['totalEpisodes'],
+        show['watchedEpisodes'],
+        show['totalSeasons'],
+        show['runtime'],
+        show['started'],
+        show['ended'],
+        truncate_text(show['description']),
+        first_watched,
+        last_watched,
+        days_watching
+    )
+    lite_row = (
+        show['titleOriginal'] or show['title'],
+        show['ruTitle'] or show['title'],
+        show['year'],
+        show['myRating'],
+        show['status']
+    )
+    return full_row, lite_row
+
+
+def export_to_csv(rows: List[Tuple[tuple, tuple]], output_file: str):
+    """Export shows data to CSV format from rows built by csv_rows"""
     csv_file = output_file.replace('.json', '.csv') if output_file.endswith('.json') else output_file + '.csv'
     
     with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        rows = []
-        
-        for show in shows_data:
-            base_info = {
-                'username': username,
-                'show_id': show['id'],
-                'title': show['title'],
-                'title_original': show['titleOriginal'],
-                'title_ru': show['ruTitle'],
-                'year': show['year'],
-                'my_status': show['status'],
-                'show_status': show['showStatus'],
-                'site_rating': show['rating'],
-                'my_rating': show['myRating'],
-                'imdb_id': show['imdbId'],
-                'imdb_rating': show['imdbRating'],
-                'kinopoisk_id': show['kinopoiskId'],
-                'kinopoisk_rating': show['kinopoiskRating'],
-                'country': show['country'],
-                'network': show['network'],
-                'genres': show['genres'],
-                'total_episodes': show['totalEpisodes'],
-                'watched_episodes': show['watchedEpisodes'],
-                'total_seasons': show['totalSeasons'],
-                'runtime': show['runtime'],
-                'started': show['started'],
-                'ended': show['ended'],
-                'description': show['description'][:200] + '...' if show['description'] and len(show['description']) > 200 else (show['description'] or '')
-            }
-            
-            if show['episodes']:
-                first_watched = min(e['watched'] for e in show['episodes'] if e['watched'])
-                last_watched = max(e['watched'] for e in show['episodes'] if e['watched'])
-                base_info['first_episode_watched'] = first_watched
-                base_info['last_episode_watched'] = last_watched
-                base_info['days_watching'] = (datetime.datetime.fromisoformat(last_watched) - 
-                                            datetime.datetime.fromisoformat(first_watched)).days if first_watched and last_watched else 0
-            else:
-                base_info['first_episode_watched'] = ''
-                base_info['last_episode_watched'] = ''
-                base_info['days_watching'] = 0
-            
-            rows.append(base_info)
-        
         if rows:
-            fieldnames = list(rows[0].keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(CSV_FULL_FIELDS)
+            writer.writerows(full_row for full_row, _ in rows)
             
     logger.info(f"Full CSV data exported to: {csv_file}")
     
@@ -448,148 +723,196 @@ def export_to_csv(shows_data: List[Dict[str, Any]], output_file: str, username:
     lite_csv_file = output_file.replace('.json', '_lite.csv') if output_file.endswith('.json') else output_file.replace('.csv', '_lite.csv')
     
     with open(lite_csv_file, 'w', newline='', encoding='utf-8') as f:
-        lite_rows = []
-        
-        for show in shows_data:
-            lite_info = {
-                'title_original': show['titleOriginal'] or show['title'],
-                'title_ru': show['ruTitle'] or show['title'],
-                'year': show['year'],
-                'my_rating': show['myRating'],
-                'status': show['status']
-            }
-            lite_rows.append(lite_info)
-        
-        if lite_rows:
-            fieldnames = ['title_original', 'title_ru', 'year', 'my_rating', 'status']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(lite_rows)
+        if rows:
+            writer = csv.writer(f)
+            writer.writerow(CSV_LITE_FIELDS)
+            writer.writerows(lite_row for _, lite_row in rows)
             
     logger.info(f"Lightweight CSV exported to: {lite_csv_file}")
     
     return csv_file
 
 
-def process_show_batch(api: Union[OldAPI, NewAPI], show_batch: List[Tuple[Any, Dict[str, Any]]], 
-                      api_version: str, progress_offset: int) -> List[Dict[str, Any]]:
-    """Process a batch of shows in parallel"""
-    batch_results = []
+async def normalize_show(executor: Optional[ProcessPoolExecutor], show_info: Dict[str, Any],
+                         show_details: Any, episodes: Any, api_version: str) -> Dict[str, Any]:
+    """Run process_show_data in the process pool, or inline when there is none"""
+    if executor is None:
+        return process_show_data(show_info, show_details, episodes, api_version)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, process_show_data, show_info, show_details, episodes, api_version
+    )
+
+
+async def process_all(api: OldAPI, show_items: List[Tuple[Any, Dict[str, Any]]], spool: 'ShowSpool',
+                      executor: Optional[ProcessPoolExecutor]) -> None:
+    """Fetch and process API v1 shows concurrently, limited by the adaptive worker count"""
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {}
-        
-        # Submit show processing tasks with staggered delays
-        for i, (show_id, show_info) in enumerate(show_batch):
-            # Add staggered delay before submitting each task
-            if i > 0:
-                time.sleep(REQUEST_DELAY / MAX_WORKERS)
-                
-            if api_version == 'v1':
-                future = executor.submit(api.get_show_data_parallel, show_info['showId'], show_info)
-                futures[future] = (show_id, show_info)
-            else:
-                if isinstance(show_info, dict):
-                    show_id_int = show_info.get('show', {}).get('id') or show_info.get('id')
-                    if show_id_int:
-                        future = executor.submit(api.get_show_data_parallel, int(show_id_int), show_info)
-                        futures[future] = (show_id_int, show_info)
-        
-        # Process completed tasks
-        completed = 0
-        for future in as_completed(futures):
-            completed += 1
-            show_id, original_info = futures[future]
+    async def one(show_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            async with CONCURRENCY:
+                _, show_details, episodes = await api.get_show_data_parallel(show_info['showId'], show_info)
             
+            # Normalize outside the worker slot so the next fetch can start
+            return await normalize_show(executor, show_info, show_details, episodes, 'v1')
+        except Exception as e:
+            show_title = show_info.get('title', 'Unknown')
+            logger.error(f"Failed to process show {show_title}: {e}")
+            return None
+    
+    # Spool shows as they finish so slow ones never hold back the rest
+    tasks = [one(show_info) for _, show_info in show_items]
+    for completed, task in enumerate(asyncio.as_completed(tasks), 1):
+        show_data = await task
+        if show_data is not None:
             try:
-                show_info, show_details, episodes = future.result()
-                show_data = process_show_data(show_info, show_details, episodes, api_version)
-                batch_results.append(show_data)
-                
-                # Log progress
-                if completed % 10 == 0:
-                    logger.info(f"Processed {progress_offset + completed} shows...")
-                    
+                spool.add(show_data)
             except Exception as e:
-                show_title = original_info.get('title', 'Unknown')
-                logger.error(f"Failed to process show {show_title}: {e}")
-                
-            # Additional delay after processing each result  
-            time.sleep(REQUEST_DELAY)
-    
-    return batch_results
+                logger.error(f"Failed to save show {show_data.get('title') or 'Unknown'}: {e}")
+        
+        # Log progress
+        if completed % 10 == 0:
+            logger.info(f"Processed {completed} shows...")
 
 
-def backup_shows_fast(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None, 
-                     api_version: str = 'v1') -> List[Dict[str, Any]]:
-    """Fast parallel backup of all shows data"""
-    
-    start_time = time.time()
-    
-    # Authenticate
-    if not api.authenticate():
-        raise RuntimeError("Authentication failed. Please check your credentials.")
-    
-    # Retrieve all shows
-    logger.info("Fetching shows list...")
-    all_shows = api.get_all_shows()
+async def process_rpc_batch(api: NewAPI, show_batch: List[Tuple[Any, Dict[str, Any]]], 
+                            progress_offset: int, executor: Optional[ProcessPoolExecutor]) -> List[Dict[str, Any]]:
+    """Process a batch of API v2 shows with JSON-RPC batch requests"""
+    batch_items = []
+    for _, show_info in show_batch:
+        if isinstance(show_info, dict):
+            show_id = show_info.get('show', {}).get('id') or show_info.get('id')
+            if show_id:
+                batch_items.append((int(show_id), show_info))
     
-    if not all_shows:
-        logger.warning("No shows found for this user")
+    if not batch_items:
         return []
     
-    # Convert to list of tuples for batch processing
-    if api_version == 'v1':
-        show_items = list(all_shows.items())
-    else:
-        show_items = [(i, show) for i, show in enumerate(all_shows)]
-    
-    total_shows = len(show_items)
-    logger.info(f"Found {total_shows} shows. Starting parallel processing...")
+    try:
+        # Hold a worker slot for the fetch only, as process_all does
+        async with CONCURRENCY:
+            shows_data = await api.get_shows_data_batch([show_id for show_id, _ in batch_items])
+    except Exception as e:
+        logger.error(f"Failed to fetch shows {progress_offset + 1}-{progress_offset + len(show_batch)}: {e}")
+        return []
     
-    # Process shows in batches
-    shows_data = []
-    for i in range(0, total_shows, BATCH_SIZE):
-        batch = show_items[i:i + BATCH_SIZE]
-        logger.info(f"Processing batch {i//BATCH_SIZE + 1}/{(total_shows + BATCH_SIZE - 1)//BATCH_SIZE}")
-        
-        batch_results = process_show_batch(api, batch, api_version, i)
-        shows_data.extend(batch_results)
+    async def one(show_info: Dict[str, Any], show_details: Any, episodes: Any) -> Optional[Dict[str, Any]]:
+        try:
+            if show_details is None or episodes is None:
+                raise Exception("incomplete RPC response")
+            return await normalize_show(executor, show_info, show_details, episodes, 'v2')
+        except Exception as e:
+            show_title = show_info.get('show', {}).get('title') or show_info.get('title', 'Unknown')
+            logger.error(f"Failed to process show {show_title}: {e}")
+            return None
     
-    # Sort shows by first watched episode date
-    shows_data.sort(key=lambda show: (
-        show['episodes'][0]['watched'] if show['episodes'] else '9999-99-99'
+    results = await asyncio.gather(*(
+        one(show_info, show_details, episodes)
+        for (_, show_info), (show_details, episodes) in zip(batch_items, shows_data)
     ))
+    batch_results = [show_data for show_data in results if show_data is not None]
+    
+    logger.info(f"Processed shows {progress_offset + 1}-{progress_offset + len(show_batch)}")
+    return batch_results
+
+
+async def process_all_rpc(api: NewAPI, show_items: List[Tuple[Any, Dict[str, Any]]], spool: 'ShowSpool',
+                          executor: Optional[ProcessPoolExecutor]) -> None:
+    """Fetch and process API v2 shows in concurrent JSON-RPC batches"""
+    tasks = [
+        process_rpc_batch(api, show_items[offset:offset + BATCH_SIZE], offset, executor)
+        for offset in range(0, len(show_items), BATCH_SIZE)
+    ]
+    for task in asyncio.as_completed(tasks):
+        for show_data in await task:
+            try:
+                spool.add(show_data)
+            except Exception as e:
+                logger.error(f"Failed to save show {show_data.get('title') or 'Unknown'}: {e}")
+
+
+async def fetch_shows_async(api: Union[OldAPI, NewAPI], api_version: str, spool: 'ShowSpool') -> int:
+    """Authenticate, list all shows and spool their data on one event loop"""
+    # Fresh limiters per run: their state and asyncio.Condition must not leak across event loops
+    global RATE_LIMITER, CONCURRENCY
+    RATE_LIMITER = RequestScheduler(REQUEST_DELAY / MAX_WORKERS)
+    CONCURRENCY = AdaptiveLimiter(MAX_WORKERS, MAX_CONCURRENCY)
     
-    # Calculate processing time
-    processing_time = time.time() - start_time
-    logger.info(f"Processing completed in {processing_time:.1f} seconds ({processing_time/60:.1f} minutes)")
-    logger.info(f"Average time per show: {processing_time/total_shows:.2f} seconds")
+    async with api:
+        # Authenticate
+        if not await api.authenticate():
+            raise RuntimeError("Authentication failed. Please check your credentials.")
+        
+        # Retrieve all shows
+        logger.info("Fetching shows list...")
+        all_shows = await api.get_all_shows()
+        
+        if not all_shows:
+            logger.warning("No shows found for this user")
+            return 0
+        
+        # Convert to list of tuples for processing
+        if api_version == 'v1':
+            show_items = list(all_shows.items())
+        else:
+            show_items = [(i, show) for i, show in enumerate(all_shows)]
+        
+        total_shows = len(show_items)
+        logger.info(f"Found {total_shows} shows. Starting concurrent processing...")
+        
+        # Normalizing episodes is CPU-bound, so it runs in worker processes beside the event loop;
+        # with a single CPU the pickling round trip would only add overhead
+        pool = ProcessPoolExecutor(max_workers=PROCESS_WORKERS) if PROCESS_WORKERS > 1 else nullcontext()
+        with pool as executor:
+            if api_version == 'v1':
+                await process_all(api, show_items, spool, executor)
+            else:
+                # One batch request per call type instead of one request per show
+                await process_all_rpc(api, show_items, spool, executor)
+        
+        return total_shows
+
+
+def backup_shows_fast(api: Union[OldAPI, NewAPI], output_file: Optional[str] = None, 
+                     api_version: str = 'v1') -> int:
+    """Fast concurrent backup of all shows data, returning the number of shows saved"""
     
-    # Prepare final result
+    start_time = time.time()
     username = getattr(api, 'username', 'unknown')
-    result = {
-        'metadata': {
+    
+    with ShowSpool(username, with_csv=bool(output_file)) as spool:
+        total_shows = asyncio.run(fetch_shows_async(api, api_version, spool))
+        if not total_shows:
+            return 0
+        
+        # Sort shows by first watched episode date
+        spool.sort()
+        
+        # Calculate processing time
+        processing_time = time.time() - start_time
+        logger.info(f"Processing completed in {processing_time:.1f} seconds ({processing_time/60:.1f} minutes)")
+        logger.info(f"Average time per show: {processing_time/total_shows:.2f} seconds")
+        
+        metadata = {
             'username': username,
             'backup_date': datetime.datetime.now().isoformat(),
-            'total_shows': len(shows_data),
+            'total_shows': len(spool),
             'api_version': api_version,
             'processing_time_seconds': round(processing_time, 2)
-        },
-        'shows': shows_data
-    }
-    
-    # Save results
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-        logger.info(f"JSON data saved to: {output_file}")
+        }
         
-        export_to_csv(shows_data, output_file, username)
-    else:
-        print(json.dumps(result, ensure_ascii=False, indent=2))
-    
-    return shows_data
+        # Save results
+        if output_file:
+            with open(output_file, 'wb') as f:
+                spool.write_json(f, metadata)
+            logger.info(f"JSON data saved to: {output_file}")
+            
+            export_to_csv(spool.csv_rows, output_file)
+        else:
+            sys.stdout.flush()
+            spool.write_json(sys.stdout.buffer, metadata)
+            sys.stdout.buffer.write(b'\n')
+        
+        return len(spool)
 
 
 def get_api_version(args) -> str:
@@ -657,9 +980,10 @@ Examples:
     
 Performance notes:
   - Default: 5 parallel workers (balanced for speed and stability)
+  - Worker count adapts: grows while requests succeed, halves when throttled
   - Processes shows in batches of 25
-  - Includes exponential backoff for 503 errors  
-  - Request delay: 0.1s between requests
+  - Backs off on 429/5xx errors, honoring Retry-After, across all workers
+  - Request delay: 0.1s between requests per worker (shared rate limit)
   - Typically 3-5x faster than sequential version
   - Use -w and -d to adjust if you get 503 errors
         """
@@ -672,7 +996,7 @@ Performance notes:
     parser.add_argument('-w', '--workers', type=int, default=5, 
                        help='Number of parallel workers (default: 5)')
     parser.add_argument('-d', '--delay', type=float, default=0.1,
-                       help='Delay between requests in seconds (default: 0.1)')
+                       help='Delay between requests per worker in seconds (default: 0.1)')
     
     args = parser.parse_args()
     